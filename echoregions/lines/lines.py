@@ -1,4 +1,3 @@
-import json
 from typing import Dict, Iterable, List, Union
 
 import matplotlib.pyplot as plt
@@ -52,26 +51,31 @@ class Lines:
             return
 
         regions = self.data if inplace else self.data.copy()
-        regions["depth"] = regions["depth"].apply(
-            lambda x: self._nan_depth_value if x == ECHOVIEW_NAN_DEPTH_VALUE else x
+        # Replace all matching depth values in a single vectorized pass
+        regions["depth"] = regions["depth"].mask(
+            regions["depth"] == ECHOVIEW_NAN_DEPTH_VALUE, self._nan_depth_value
         )
         if not inplace:
             return regions
 
-    def to_csv(self, save_path: bool = None) -> None:
+    def to_csv(self, save_path: bool = None, **kwargs) -> None:
         """Save a Dataframe to a .csv file
 
         Parameters
         ----------
         save_path : str
             path to save the CSV file to
+        kwargs
+            keyword arguments passed into Pandas `to_csv`, e.g. `chunksize`
+            to control how many rows are written at a time. `index` defaults to False.
         """
         # Check if the save directory is safe
         save_path = validate_path(
             save_path=save_path, input_file=self.input_file, ext=".csv"
         )
-        # Reorder columns and export to csv
-        self.data.to_csv(save_path, index=False)
+        # Export to csv without the DataFrame index unless requested otherwise
+        kwargs.setdefault("index", False)
+        self.data.to_csv(save_path, **kwargs)
         self.output_file.append(save_path)
 
     def to_json(self, save_path: str = None, pretty: bool = True, **kwargs) -> None:
@@ -93,9 +97,8 @@ class Lines:
         )
         indent = 4 if pretty else None
 
-        # Save the entire parsed EVR dictionary as a JSON file
-        with open(save_path, "w") as f:
-            f.write(json.dumps(self.data.to_json(), indent=indent))
+        # Serialize the parsed EVL DataFrame straight to the JSON file
+        self.data.to_json(save_path, indent=indent)
         self.output_file.append(save_path)
 
     def plot(
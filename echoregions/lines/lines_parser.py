@@ -1,10 +1,20 @@
 import os
 
+import numpy as np
 import pandas as pd
 
 from ..utils.io import check_file
 from ..utils.time import parse_time
 
+TOKEN_COLUMNS = ["date", "time", "depth", "status"]
+POINT_COLUMNS = ["time", "depth", "status"]
+# Types of the date, time, depth and status tokens of each point line
+TOKEN_DTYPES = {0: str, 1: str, 2: np.float64, 3: str}
+MALFORMED_POINT_LINE_MESSAGE = (
+    "There exists a malformed point line in the file. Each point line must"
+    " contain exactly 4 values: date, time, a numeric depth and status."
+)
+
 
 def parse_line_file(input_file: str):
     """Parse EVL Line File and place data in Pandas Dataframe.
@@ -20,11 +30,29 @@ def parse_line_file(input_file: str):
     """
     # Check for validity of input_file
     check_file(input_file, "EVL")
-    # Read file and read all lines
-    fid = open(input_file, encoding="utf-8-sig")
-    file_lines = fid.readlines()
-    # Read header containing metadata about the EVL file
-    file_type, file_format_number, ev_version = file_lines[0].strip().split()
+    # Read file header and point lines
+    with open(input_file, encoding="utf-8-sig") as fid:
+        # Read header containing metadata about the EVL file
+        file_type, file_format_number, ev_version = fid.readline().strip().split()
+        n_points = int(fid.readline().strip())
+        # Tokenize all point lines in a single C-level pass. Blank lines are kept
+        # so that every line after the header counts as a point row.
+        try:
+            points = pd.read_csv(
+                fid,
+                sep=r"\s+",
+                header=None,
+                index_col=False,
+                dtype=TOKEN_DTYPES,
+                float_precision="round_trip",
+                skip_blank_lines=False,
+                engine="c",
+            )
+        except pd.errors.EmptyDataError:
+            points = pd.DataFrame(columns=list(TOKEN_DTYPES)).astype(TOKEN_DTYPES)
+        except ValueError as e:
+            # Lines with extra tokens or non-numeric depths fail during tokenization
+            raise ValueError(MALFORMED_POINT_LINE_MESSAGE) from e
     file_metadata = {
         "file_name": os.path.splitext(os.path.basename(input_file))[0]
         + os.path.splitext(os.path.basename(input_file))[1],
@@ -32,34 +60,28 @@ def parse_line_file(input_file: str):
         "evl_file_format_version": file_format_number,
         "echoview_version": ev_version,
     }
-    points = []
-    n_points = int(file_lines[1].strip())
     # Check if there is a correct matching of points and file lines.
-    if (len(file_lines) - 2) != n_points:
+    if len(points) != n_points:
         raise ValueError(
             "There exists a mismatch between the expected number of lines in the file"
             "and the actual number of points. There should be 2 less lines in the file than"
-            f"the number of points, however we have {len(file_lines)} number of lines in the file"
+            f"the number of points, however we have {len(points) + 2} number of lines in the file"
             f"and {n_points} number of points."
         )
-    for i in range(n_points):
-        date, time, depth, status = file_lines[i + 2].strip().split()
-        points.append(
-            {
-                "time": f"{date} {time}",  # Format: CCYYMMDD HHmmSSssss
-                "depth": float(depth),  # Depth [m]
-                "status": status,  # 0 = none, 1 = unverified, 2 = bad, 3 = good
-            }
-        )
-    # Store JSON serializable data
-    data_dict = {"metadata": file_metadata, "points": points}
+    # Check that every point line holds exactly date, time, depth and status tokens.
+    if points.shape[1] != len(TOKEN_COLUMNS) or points.isna().any(axis=None):
+        raise ValueError(MALFORMED_POINT_LINE_MESSAGE)
+    points.columns = TOKEN_COLUMNS
 
-    # Put data into a DataFrame
-    df = pd.DataFrame(data_dict["points"])
+    # Format: CCYYMMDD HHmmSSssss
+    points["time"] = points["date"] + " " + points["time"]
+    # Depth [m] and status (0 = none, 1 = unverified, 2 = bad, 3 = good) are kept as parsed
+    df = points[POINT_COLUMNS]
     # Save file metadata for each point
-    df = df.assign(**data_dict["metadata"])
-    df.loc[:, "time"] = df.loc[:, "time"].apply(parse_time)
-    order = list(data_dict["metadata"].keys()) + list(data_dict["points"][0].keys())
+    df = df.assign(**file_metadata)
+    # Parse all point times in a single vectorized call
+    df["time"] = parse_time(df["time"].tolist())
+    order = list(file_metadata.keys()) + POINT_COLUMNS
     data = df[order]
 
     return data
@@ -6,7 +6,6 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import regionmask
 import xarray as xr
 from pandas import DataFrame, Series, Timestamp, isna
 from xarray import DataArray
@@ -50,20 +49,24 @@ class Regions2D:
     def __getitem__(self, val: int) -> Series:
         return self.data.iloc[val]
 
-    def to_csv(self, save_path: bool = None) -> None:
+    def to_csv(self, save_path: bool = None, **kwargs) -> None:
         """Save a Dataframe to a .csv file
 
         Parameters
         ----------
         save_path : str
             path to save the CSV file to
+        kwargs
+            keyword arguments passed into Pandas `to_csv`, e.g. `chunksize`
+            to control how many rows are written at a time. `index` defaults to False.
         """
         # Check if the save directory is safe
         save_path = validate_path(
             save_path=save_path, input_file=self.input_file, ext=".csv"
         )
-        # Reorder columns and export to csv
-        self.data.to_csv(save_path, index=False)
+        # Export to csv without the DataFrame index unless requested otherwise
+        kwargs.setdefault("index", False)
+        self.data.to_csv(save_path, **kwargs)
         self.output_file.append(save_path)
 
     def to_json(self, save_path: str = None) -> None:
@@ -107,11 +110,7 @@ class Regions2D:
             and each row has time and depth within or on the boundaries passed
             in by the ``time_range`` and ``depth_range`` values.
         """
-        # Make copy of original dataframe; else, use original dataframe in selection.
-        if copy:
-            region = self.data.copy()
-        else:
-            region = self.data
+        region = self.data
         if region_id is not None:
             if isinstance(region_id, (float, int, str)):
                 region_id = [region_id]
@@ -128,7 +127,7 @@ class Regions2D:
                             type: {type(value)}Must be \
                             of type float, int, str."
                     )
-            region = self.data[self.data["region_id"].isin(region_id)]
+            region = region[region["region_id"].isin(region_id)]
         if time_range is not None:
             if isinstance(time_range, List):
                 if len(time_range) == 2:
@@ -207,6 +206,9 @@ class Regions2D:
                     f"Invalid depth_range type: {type(depth_range)}. Must be \
                                 of type List."
                 )
+        # Copy only the selected rows rather than the whole original dataframe.
+        if copy:
+            region = region.copy()
         return region
 
     def close_region(
@@ -315,26 +317,28 @@ class Regions2D:
         DataFrame with depth edges replaced by Regions2D.min_depth and Regions2D.max_depth
         """
 
-        def replace_depth(row: Series) -> Series:
-            def swap_val(val: Union[int, float]) -> Union[int, float]:
-                if val == 9999.99:
-                    return self.max_depth
-                elif val == -9999.99:
-                    return self.min_depth
-                else:
-                    return val
-
-            row.at["region_bbox_top"] = swap_val(row["region_bbox_top"])
-            row.at["region_bbox_bottom"] = swap_val(row["region_bbox_bottom"])
-            for idx, val in enumerate(row["depth"]):
-                row["depth"][idx] = swap_val(val)
-            return row
-
         if self.min_depth is None and self.max_depth is None:
             return
 
+        min_depth = np.nan if self.min_depth is None else self.min_depth
+        max_depth = np.nan if self.max_depth is None else self.max_depth
+
+        def swap_depth(depth: np.ndarray) -> np.ndarray:
+            """Replace range edge values of a depth array in a single vectorized pass"""
+            depth = np.asarray(depth, dtype=np.float64)
+            return np.where(
+                depth == 9999.99,
+                max_depth,
+                np.where(depth == -9999.99, min_depth, depth),
+            )
+
         regions = self.data if inplace else self.data.copy()
-        regions.loc[:] = regions.apply(replace_depth, axis=1)
+        for bbox_column in ["region_bbox_top", "region_bbox_bottom"]:
+            bbox = regions[bbox_column]
+            regions[bbox_column] = bbox.mask(
+                (bbox == 9999.99).fillna(False), max_depth
+            ).mask((bbox == -9999.99).fillna(False), min_depth)
+        regions["depth"] = regions["depth"].apply(swap_depth)
         return regions
 
     def plot(
@@ -411,23 +415,18 @@ class Regions2D:
         # Dataframe containing region information.
         region_df = self.select_region(region_ids)
 
-        # Select only columns which are important.
-        region_df = region_df[["region_id", "time", "depth"]]
-
-        # Organize the regions in a format for region mask.
-        df = region_df.explode(["time", "depth"])
+        # Select only columns which are important, ordered by region id.
+        region_df = region_df[["region_id", "time", "depth"]].sort_values("region_id")
 
-        # Convert region time to integer timestamp.
-        df["time"] = matplotlib.dates.date2num(df["time"])
-
-        # Create a list of dataframes for each regions.
-        grouped = list(df.groupby("region_id"))
-
-        # Convert to list of numpy arrays which is an acceptable format to create region mask.
-        regions_np = [np.array(region[["time", "depth"]]) for id, region in grouped]
+        # Stack each region's integer timestamps and depths into an (n_points, 2) array,
+        # which is an acceptable format to create region mask.
+        regions_np = [
+            np.column_stack([matplotlib.dates.date2num(time), depth])
+            for time, depth in zip(region_df["time"], region_df["depth"])
+        ]
 
         # Corresponding region ids converted to int.
-        region_ids = [int(id) for id, region in grouped]
+        region_ids = [int(id) for id in region_df["region_id"]]
 
         # Convert ping_time to unix_time since the masking does not work on datetime objects.
         da_Sv = da_Sv.assign_coords(
@@ -437,6 +436,9 @@ class Regions2D:
             )
         )
 
+        # Import regionmask here since it is heavy and only needed for masking.
+        import regionmask
+
         # Set up mask labels.
         if mask_labels == "from_ids":
             r = regionmask.Regions(outlines=regions_np, numbers=region_ids)
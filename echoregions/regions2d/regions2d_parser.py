@@ -1,4 +1,6 @@
+import io
 import os
+from itertools import islice
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -34,6 +36,63 @@ COLUMNS = [
 ]
 
 
+def _region_metadata_to_dict(line: List) -> Dict:
+    """Assigns a name to each value in the metadata line for each region"""
+    # Unpack the fixed layout of the region metadata line in a single step
+    (
+        structure_version,
+        point_count,
+        region_id,
+        selected,
+        creation_type,
+        dummy,
+        bound_calculated,
+        *bbox,
+    ) = line
+    bound_calculated = int(bound_calculated)
+    if bound_calculated:
+        left_date, left_time, top, right_date, right_time, bottom = bbox
+        # Times are parsed for all regions at once after the file is read
+        left = f"{left_date} {left_time}"
+        right = f"{right_date} {right_time}"
+        top = float(top)
+        bottom = float(bottom)
+    else:
+        left = None
+        right = None
+        top = None
+        bottom = None
+    return {
+        "region_id": int(region_id),
+        "region_structure_version": structure_version,  # 13 currently
+        "region_point_count": point_count,  # Number of points in the region
+        "region_selected": selected,  # Always 0
+        "region_creation_type": creation_type,  # How the region was created
+        "dummy": dummy,  # Always -1
+        "region_bbox_calculated": bound_calculated,  # 1 if next 4 fields valid.
+        # O otherwise
+        # Date encoded as CCYYMMDD and times in HHmmSSssss
+        # Where CC=Century, YY=Year, MM=Month, DD=Day, HH=Hour,
+        # mm=minute, SS=second, ssss=0.1 milliseconds
+        "region_bbox_left": left,  # Time and date of bounding box left x; none if not valid.
+        "region_bbox_right": right,  # Time and date of bounding box right x; none if not valid.
+        "region_bbox_top": top,  # Top of bounding box; none if not valid.
+        "region_bbox_bottom": bottom,  # Bottom of bounding box; none if not valid.
+    }
+
+
+def _parse_points(line: List) -> Tuple[ndarray]:
+    """Takes a line with point information and creates a tuple (x, y) for each point"""
+    # Each point is a (date, time, depth) triplet of tokens
+    tokens = np.asarray(line, dtype=str).reshape(-1, 3)
+    # Join date and time tokens into CCYYMMDD HHmmSSssss strings in one pass
+    points_x = parse_time(
+        np.char.add(np.char.add(tokens[:, 0], " "), tokens[:, 1]).tolist()
+    ).values
+    points_y = tokens[:, 2].astype(np.float64)
+    return points_x, points_y
+
+
 def parse_regions_file(input_file: str):
     """Parse EVR Regions2D File and place data in Pandas Dataframe.
 
@@ -49,59 +108,19 @@ def parse_regions_file(input_file: str):
     # Check for validity of input_file.
     check_file(input_file, "EVR")
 
-    # Read file.
-    fid = open(input_file, encoding="utf-8-sig")
-
-    def _region_metadata_to_dict(line: List) -> Dict:
-        """Assigns a name to each value in the metadata line for each region"""
-        bound_calculated = int(line[6])
-        if bound_calculated:
-            left = parse_time(f"{line[7]} {line[8]}", unix=False)
-            right = parse_time(f"{line[10]} {line[11]}", unix=False)
-            top = float(line[9])
-            bottom = float(line[12])
-        else:
-            left = None
-            right = None
-            top = None
-            bottom = None
-        return {
-            "region_id": int(line[2]),
-            "region_structure_version": line[0],  # 13 currently
-            "region_point_count": line[1],  # Number of points in the region
-            "region_selected": line[3],  # Always 0
-            "region_creation_type": line[4],  # How the region was created
-            "dummy": line[5],  # Always -1
-            "region_bbox_calculated": bound_calculated,  # 1 if next 4 fields valid.
-            # O otherwise
-            # Date encoded as CCYYMMDD and times in HHmmSSssss
-            # Where CC=Century, YY=Year, MM=Month, DD=Day, HH=Hour,
-            # mm=minute, SS=second, ssss=0.1 milliseconds
-            "region_bbox_left": left,  # Time and date of bounding box left x; none if not valid.
-            "region_bbox_right": right,  # Time and date of bounding box right x; none if not valid.
-            "region_bbox_top": top,  # Top of bounding box; none if not valid.
-            "region_bbox_bottom": bottom,  # Bottom of bounding box; none if not valid.
-        }
-
-    def _parse_points(line: str) -> Tuple[ndarray]:
-        """Takes a line with point information and creates a tuple (x, y) for each point"""
-        points_x = parse_time(
-            [f"{line[idx]} {line[idx + 1]}" for idx in range(0, len(line), 3)]
-        ).values
-        points_y = np.array([float(line[idx + 2]) for idx in range(0, len(line), 3)])
-        return points_x, points_y
+    # Read the whole file in one call and parse it from an in-memory buffer.
+    with open(input_file, encoding="utf-8-sig") as f:
+        fid = io.StringIO(f.read())
 
     # Read header containing metadata about the EVR file
     file_type, file_format_number, echoview_version = fid.readline().strip().split()
-    file_metadata = pd.Series(
-        {
-            "file_name": os.path.splitext(os.path.basename(input_file))[0]
-            + os.path.splitext(os.path.basename(input_file))[1],
-            "file_type": file_type,
-            "evr_file_format_number": file_format_number,
-            "echoview_version": echoview_version,
-        }
-    )
+    file_metadata = {
+        "file_name": os.path.splitext(os.path.basename(input_file))[0]
+        + os.path.splitext(os.path.basename(input_file))[1],
+        "file_type": file_type,
+        "evr_file_format_number": file_format_number,
+        "echoview_version": echoview_version,
+    }
     rows = []
     n_regions = int(fid.readline().strip())
     # Loop over all regions in file
@@ -112,11 +131,11 @@ def parse_regions_file(input_file: str):
         r_metadata = _region_metadata_to_dict(fid.readline().strip().split())
         # Add notes to region data
         n_note_lines = int(fid.readline().strip())
-        r_notes = [fid.readline().strip() for line in range(n_note_lines)]
+        r_notes = [line.strip() for line in islice(fid, n_note_lines)]
         # Add detection settings to region data
         n_detection_setting_lines = int(fid.readline().strip())
         r_detection_settings = [
-            fid.readline().strip() for line in range(n_detection_setting_lines)
+            line.strip() for line in islice(fid, n_detection_setting_lines)
         ]
         # Add class to region data
         r_metadata["region_class"] = fid.readline().strip()
@@ -127,23 +146,26 @@ def parse_regions_file(input_file: str):
         r_points = _parse_points(points_line)
         r_metadata["region_name"] = fid.readline().strip()
 
-        # Store region data into a Pandas series
-        row = pd.concat(
-            [
-                file_metadata,
-                pd.Series(r_metadata)[r_metadata.keys()],
-                pd.Series({"time": r_points[0]}),
-                pd.Series({"depth": r_points[1]}),
-                pd.Series({"region_notes": r_notes}),
-                pd.Series({"region_detection_settings": r_detection_settings}),
-            ]
+        # Store region data as a plain dictionary row
+        rows.append(
+            {
+                **r_metadata,
+                "time": r_points[0],
+                "depth": r_points[1],
+                "region_notes": r_notes,
+                "region_detection_settings": r_detection_settings,
+            }
         )
-        row = row.to_frame().T
-        rows.append(row)
 
     if len(rows) == 0:
         data = pd.DataFrame(columns=COLUMNS)
     else:
-        df = pd.concat(rows, ignore_index=True)
-        data = df[rows[0].keys()].convert_dtypes()
+        # Construct the DataFrame once from all collected rows
+        df = pd.DataFrame.from_records(rows)
+        # Save file metadata for each region in a single insertion
+        df = df.assign(**file_metadata)
+        # Parse bounding box times of all regions in a single vectorized call
+        for bbox_column in ["region_bbox_left", "region_bbox_right"]:
+            df[bbox_column] = parse_time(df[bbox_column].tolist())
+        data = df[COLUMNS].convert_dtypes()
     return data
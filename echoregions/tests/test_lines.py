@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -73,6 +74,70 @@ def test_lines_parsing(lines_fixture: Lines) -> None:
     assert df_lines.loc[4]["status"] == "3"
 
 
+@pytest.mark.lines
+def test_lines_parsing_point_count_mismatch(tmp_path: Path) -> None:
+    """
+    Test that parsing an EVL file whose point count does not match its point lines,
+    or whose point lines are malformed, fails.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory to write the truncated and malformed EVL files to.
+    """
+
+    # Keep the header and only the first 3 of the 3171 point lines
+    with open(EVL_PATH, encoding="utf-8-sig") as f:
+        truncated_lines = f.readlines()[:5]
+    truncated_evl = tmp_path / "truncated.evl"
+    truncated_evl.write_text("".join(truncated_lines))
+
+    with pytest.raises(ValueError):
+        er.read_evl(truncated_evl)
+
+    # Keep the first 2 point lines with a matching point count
+    header_line = truncated_lines[0]
+    point_line = truncated_lines[2]
+    date, time, depth, status = point_line.split()
+
+    # Check a point line missing its status token
+    missing_token_evl = tmp_path / "missing_token.evl"
+    missing_token_evl.write_text(
+        "".join([header_line, "2\n", point_line, f"{date} {time} {depth}\n"])
+    )
+    with pytest.raises(ValueError, match="malformed point line"):
+        er.read_evl(missing_token_evl)
+
+    # Check a point line with an extra token
+    extra_token_evl = tmp_path / "extra_token.evl"
+    extra_token_evl.write_text(
+        "".join([header_line, "2\n", point_line, f"{date} {time} {depth} {status} 0\n"])
+    )
+    with pytest.raises(ValueError, match="malformed point line"):
+        er.read_evl(extra_token_evl)
+
+    # Check a point line with a non-numeric depth
+    bad_depth_evl = tmp_path / "bad_depth.evl"
+    bad_depth_evl.write_text(
+        "".join([header_line, "2\n", point_line, f"{date} {time} abc {status}\n"])
+    )
+    with pytest.raises(ValueError, match="malformed point line"):
+        er.read_evl(bad_depth_evl)
+
+    # Check a blank point line
+    blank_line_evl = tmp_path / "blank_line.evl"
+    blank_line_evl.write_text("".join([header_line, "2\n", point_line, "\n"]))
+    with pytest.raises(ValueError, match="malformed point line"):
+        er.read_evl(blank_line_evl)
+
+    # Check that a file without points keeps a numeric depth column
+    zero_point_evl = tmp_path / "zero_point.evl"
+    zero_point_evl.write_text("".join([header_line, "0\n"]))
+    df_zero_point = er.read_evl(zero_point_evl).data
+    assert df_zero_point.shape == (0, 7)
+    assert df_zero_point["depth"].dtype == np.float64
+
+
 @pytest.mark.lines
 def test_evl_to_file(lines_fixture: Lines) -> None:
     """
@@ -92,6 +157,11 @@ def test_evl_to_file(lines_fixture: Lines) -> None:
     lines_fixture.to_csv(output_csv)
     lines_fixture.to_json(output_json)
 
+    # Check that the JSON file decodes to the parsed data in a single load
+    with open(lines_fixture.output_file[1]) as f:
+        json_data = json.load(f)
+    assert len(json_data["depth"]) == lines_fixture.data.shape[0]
+
     # Remove files
     for path in lines_fixture.output_file:
         assert os.path.exists(path)
@@ -102,6 +172,32 @@ def test_evl_to_file(lines_fixture: Lines) -> None:
     os.rmdir(output_json)
 
 
+@pytest.mark.lines
+def test_evl_to_csv_kwargs(lines_fixture: Lines, tmp_path: Path) -> None:
+    """
+    Test that keyword arguments of Lines.to_csv are forwarded to Pandas `to_csv`.
+
+    Parameters
+    ----------
+    lines_fixture : Lines
+        Object containing data of test EVL file.
+    tmp_path : Path
+        Temporary directory to write the CSV files to.
+    """
+
+    # Write a subset of columns in chunks
+    columns = ["time", "depth"]
+    lines_fixture.to_csv(tmp_path / "columns.csv", columns=columns, chunksize=500)
+    df_columns = pd.read_csv(lines_fixture.output_file[0])
+    assert list(df_columns.columns) == columns
+    assert len(df_columns) == len(lines_fixture.data)
+
+    # Override the default index=False
+    lines_fixture.to_csv(tmp_path / "index.csv", columns=columns, index=True)
+    df_index = pd.read_csv(lines_fixture.output_file[1])
+    assert list(df_index.columns) == ["Unnamed: 0"] + columns
+
+
 @pytest.mark.lines
 def test_plot(lines_fixture: Lines) -> None:
     """
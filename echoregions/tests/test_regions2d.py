@@ -109,6 +109,38 @@ def test_missing_bbox_regions2d_parsing() -> None:
     assert pd.isna(df_select_bad_columns.iloc[0]["region_bbox_bottom"])
 
 
+@pytest.mark.regions2d
+def test_zero_point_regions2d_parsing(tmp_path: Path) -> None:
+    """
+    Tests EVR parsing of a region that has no points.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory to write the zero point EVR file to.
+    """
+
+    # Keep the first region of the missing bbox file and strip its points,
+    # leaving only the region type token on the points line
+    with open(DATA_DIR / "transect_missing_bbox.evr", encoding="utf-8-sig") as f:
+        evr_lines = f.readlines()[:10]
+    evr_lines[1] = "1\n"
+    evr_lines[3] = evr_lines[3].replace("13 4 1", "13 0 1", 1)
+    evr_lines[8] = "2\n"
+    zero_point_evr = tmp_path / "zero_point.evr"
+    zero_point_evr.write_text("".join(evr_lines))
+
+    # Read evr into regions2d
+    r2d = er.read_evr(zero_point_evr)
+
+    # Check shape and empty point arrays
+    assert r2d.data.shape == (1, 22)
+    assert r2d.data.loc[0]["region_point_count"] == "0"
+    assert len(r2d.data.loc[0]["time"]) == 0
+    assert len(r2d.data.loc[0]["depth"]) == 0
+    assert r2d.data.loc[0]["region_type"] == "2"
+
+
 @pytest.mark.regions2d
 def test_regions2d_parsing(regions2d_fixture: Regions2D) -> None:
     """
@@ -190,6 +222,32 @@ def test_evr_to_file(regions2d_fixture: Regions2D) -> None:
     os.rmdir(output_csv)
 
 
+@pytest.mark.regions2d
+def test_evr_to_csv_kwargs(regions2d_fixture: Regions2D, tmp_path: Path) -> None:
+    """
+    Test that keyword arguments of Regions2D.to_csv are forwarded to Pandas `to_csv`.
+
+    Parameters
+    ----------
+    regions2d_fixture : Regions2D
+        Object containing data of test EVR file.
+    tmp_path : Path
+        Temporary directory to write the CSV files to.
+    """
+
+    # Write a subset of columns
+    columns = ["region_id", "region_name"]
+    regions2d_fixture.to_csv(tmp_path / "columns.csv", columns=columns, chunksize=5)
+    df_columns = pd.read_csv(regions2d_fixture.output_file[0])
+    assert list(df_columns.columns) == columns
+    assert len(df_columns) == len(regions2d_fixture.data)
+
+    # Override the default index=False
+    regions2d_fixture.to_csv(tmp_path / "index.csv", columns=columns, index=True)
+    df_index = pd.read_csv(regions2d_fixture.output_file[1])
+    assert list(df_index.columns) == ["Unnamed: 0"] + columns
+
+
 @pytest.mark.regions2d
 def test_plot(regions2d_fixture: Regions2D) -> None:
     """
@@ -304,6 +362,42 @@ def test_invalid_select_sonar_file(regions2d_fixture: Regions2D) -> None:
         regions2d_fixture.select_sonar_file(raw_files_with_invalid_simrad_format, 11)
 
 
+@pytest.mark.regions2d
+def test_replace_nan_depth() -> None:
+    """
+    Test replacing range edge depth values for both inplace=True and inplace=False.
+    """
+
+    # Replace range edges without modifying the original data
+    r2d_1 = er.read_evr(
+        DATA_DIR / "transect_missing_bbox.evr", min_depth=0, max_depth=800
+    )
+    regions = r2d_1.replace_nan_depth(inplace=False)
+    assert (regions.loc[0]["depth"] == [0, 800, 800, 0]).all()
+    assert regions.loc[0]["region_bbox_top"] == 0
+    assert regions.loc[0]["region_bbox_bottom"] == 800
+    assert pd.isna(regions.loc[1]["region_bbox_top"])
+    assert (r2d_1.data.loc[0]["depth"] == [-9999.99, 9999.99, 9999.99, -9999.99]).all()
+    assert r2d_1.data.loc[0]["region_bbox_top"] == -9999.99
+
+    # Replace range edges inplace
+    r2d_2 = er.read_evr(
+        DATA_DIR / "transect_missing_bbox.evr", min_depth=0, max_depth=800
+    )
+    r2d_2.replace_nan_depth(inplace=True)
+    assert (r2d_2.data.loc[0]["depth"] == [0, 800, 800, 0]).all()
+    assert r2d_2.data.loc[0]["region_bbox_bottom"] == 800
+
+    # Replace range edges with only a max depth, leaving min range edges missing
+    r2d_3 = er.read_evr(DATA_DIR / "transect_missing_bbox.evr", max_depth=800)
+    regions = r2d_3.replace_nan_depth(inplace=False)
+    depth = regions.loc[0]["depth"]
+    assert np.isnan(depth[[0, 3]]).all()
+    assert (depth[[1, 2]] == 800).all()
+    assert pd.isna(regions.loc[0]["region_bbox_top"])
+    assert regions.loc[0]["region_bbox_bottom"] == 800
+
+
 @pytest.mark.regions2d
 def test_select_region(regions2d_fixture: Regions2D) -> None:
     """
@@ -58,26 +58,24 @@ def parse_simrad_fname_time(filenames: List[str]) -> datetime64:
     datetime : np.datetime64
         converted input datetime
     """
-    if isinstance(filenames, list):
-        f_list = []
-        for f in filenames:
-            if isinstance(f, str):
-                groups = SIMRAD_FILENAME_MATCHER.match(f)
-                try:
-                    f_list.append(groups["date"] + " " + groups["time"])
-                except:
-                    raise ValueError(
-                        f"Invalid value {f} in filenames."
-                        "Read documentation on correct SIMRAD format"
-                        "in the API reference for Regions2D's select_sonar_file."
-                    )
-            else:
-                raise TypeError(
-                    "Filenames contains non string element."
-                    f"Invalid element is of type {type(f)}"
-                )
-    else:
+    if not isinstance(filenames, list):
         raise TypeError(
             f"Filenames must be type list. Filenames is of type {type(filenames)}"
         )
+    f_list = []
+    for f in filenames:
+        if not isinstance(f, str):
+            raise TypeError(
+                "Filenames contains non string element."
+                f"Invalid element is of type {type(f)}"
+            )
+        groups = SIMRAD_FILENAME_MATCHER.match(f)
+        if groups is None:
+            raise ValueError(
+                f"Invalid value {f} in filenames."
+                "Read documentation on correct SIMRAD format"
+                "in the API reference for Regions2D's select_sonar_file."
+            )
+        f_list.append(f"{groups['date']} {groups['time']}")
+    # Parse all filename times in a single vectorized call
     return parse_time(f_list, "%Y%m%d %H%M%S")